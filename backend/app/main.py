@@ -15,6 +15,7 @@ from .routes.predict import router as predict_router
 from .models.yolo_model import YOLOModel
 from .config import MODEL_PATH
 from .utils.preprocess import preprocess_image
+from .utils.output import parse_predict_options
 
 app = FastAPI(title="Project Bayani Backend")
 
@@ -58,13 +59,15 @@ async def ws_predict(websocket: WebSocket):
                 await websocket.send_json({"error": "missing image"})
                 continue
             try:
+                options = parse_predict_options(data)
+
                 # Decode base64 image
                 payload = img_b64.split(",")[-1]
                 content = base64.b64decode(payload)
                 image = Image.open(io.BytesIO(content)).convert("RGB")
                 
                 inp = preprocess_image(image)
-                preds = _ws_model.predict(inp, orig_size=image.size, pil_image=image)
+                preds = _ws_model.predict(inp, orig_size=image.size, pil_image=image, options=options)
                 
                 await websocket.send_json({"predictions": preds})
             except Exception as e:
@@ -3,6 +3,8 @@ import numpy as np
 from PIL import Image
 import os
 
+from ..utils.output import PredictOptions, select_detections, format_detections, to_numpy
+
 try:
     import onnxruntime as ort
 except Exception:
@@ -37,63 +39,63 @@ class YOLOModel:
             except Exception:
                 self.session = None
 
-    def predict(self, input_tensor: np.ndarray | None, orig_size: Tuple[int, int], pil_image: Image.Image | None = None) -> List[Dict[str, Any]]:
+    def predict(self, input_tensor: np.ndarray | None, orig_size: Tuple[int, int], pil_image: Image.Image | None = None, options: PredictOptions | None = None) -> List[Dict[str, Any]] | Dict[str, Any]:
+        options = options or PredictOptions()
         if self.pt_model is not None and pil_image is not None:
             try:
                 dev = 'cuda' if TORCH_AVAILABLE and torch is not None and torch.cuda.is_available() else 'cpu'
-                res = self.pt_model.predict(pil_image, device=dev, verbose=False)
+                # Let Ultralytics' NMS apply the score, class and max_det limits
+                kwargs: Dict[str, Any] = {
+                    'conf': options.min_score,
+                    'max_det': options.max_det,
+                }
+                if options.classes is not None:
+                    names = getattr(self.pt_model, 'names', {}) or {}
+                    kwargs['classes'] = [i for i, n in names.items() if n in options.classes]
+                    if not kwargs['classes']:
+                        return self._empty(options)
+                if kwargs['max_det'] == 0:
+                    return self._empty(options)
+                res = self.pt_model.predict(pil_image, device=dev, verbose=False, **kwargs)
             except Exception:
-                return []
-            return self._postprocess_pt(res, orig_size)
+                return self._empty(options)
+            return self._postprocess_pt(res, orig_size, options)
         if self.session is not None and input_tensor is not None:
             inputs = {self.session.get_inputs()[0].name: input_tensor}
             outputs = self.session.run(None, inputs)
-            return self._postprocess_onnx(outputs, orig_size)
-        return []
+            return self._postprocess_onnx(outputs, orig_size, options)
+        return self._empty(options)
+
+    def _empty(self, options: PredictOptions) -> List[Dict[str, Any]] | Dict[str, Any]:
+        return format_detections(np.zeros((0, 4)), np.zeros(0), np.zeros(0, dtype=np.int64), {}, options)
 
-    def _postprocess_onnx(self, outputs: list, orig_size: Tuple[int, int]) -> List[Dict[str, Any]]:
-        result: List[Dict[str, Any]] = []
+    def _postprocess_onnx(self, outputs: list, orig_size: Tuple[int, int], options: PredictOptions) -> List[Dict[str, Any]] | Dict[str, Any]:
         if not outputs:
-            return result
+            return self._empty(options)
         preds = outputs[0]
-        if preds is None:
-            return result
-        if getattr(preds, 'ndim', 0) == 2:
-            for row in preds:
-                if row.shape[0] >= 5:
-                    x1, y1, x2, y2 = row[:4]
-                    sc = float(row[4])
-                    if sc < 0.25:
-                        continue
-                    result.append({
-                        'bbox': [float(x1), float(y1), float(x2), float(y2)],
-                        'score': sc,
-                        'label': 'object',
-                    })
-        return result
+        if preds is None or getattr(preds, 'ndim', 0) != 2 or preds.shape[1] < 5:
+            return self._empty(options)
+        names = {0: 'object'}
+        cls_ids = np.zeros(preds.shape[0], dtype=np.int64)
+        xyxy, scores, cls_ids = select_detections(preds[:, :4], preds[:, 4], cls_ids, names, options)
+        return format_detections(xyxy, scores, cls_ids, names, options)
 
-    def _postprocess_pt(self, results: list, orig_size: Tuple[int, int]) -> List[Dict[str, Any]]:
-        out: List[Dict[str, Any]] = []
+    def _postprocess_pt(self, results: list, orig_size: Tuple[int, int], options: PredictOptions) -> List[Dict[str, Any]] | Dict[str, Any]:
         if not results:
-            return out
+            return self._empty(options)
         r = results[0]
         try:
             boxes = r.boxes
-            xyxy = boxes.xyxy
-            conf = boxes.conf
-            cls = boxes.cls
+            xyxy = to_numpy(boxes.xyxy).reshape(-1, 4)
+            n = xyxy.shape[0]
+            scores = to_numpy(boxes.conf).reshape(-1) if boxes.conf is not None else np.zeros(n)
+            cls_ids = to_numpy(boxes.cls).reshape(-1).astype(np.int64) if boxes.cls is not None else np.full(n, -1, dtype=np.int64)
             names = getattr(r, 'names', {})
-            for i in range(len(xyxy)):
-                x1, y1, x2, y2 = [float(v) for v in xyxy[i].tolist()]
-                sc = float(conf[i].item()) if conf is not None else 0.0
-                idx = int(cls[i].item()) if cls is not None else -1
-                label = names[idx] if isinstance(names, dict) and idx in names else 'object'
-                if sc < 0.25:
-                    continue
-                out.append({'bbox': [x1, y1, x2, y2], 'score': sc, 'label': label})
+            if not isinstance(names, dict):
+                names = {}
+            return format_detections(xyxy, scores, cls_ids, names, options)
         except Exception:
-            return out
-        return out
+            return self._empty(options)
 
     def get_model_info(self) -> Dict[str, Any]:
         info: Dict[str, Any] = {
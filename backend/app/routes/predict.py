@@ -1,9 +1,11 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from typing import Literal
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query
 from fastapi.responses import JSONResponse
 from PIL import Image
 import io
 
 from ..utils.preprocess import preprocess_image
+from ..utils.output import PredictOptions, DEFAULT_MAX_DET, DEFAULT_MIN_SCORE, MAX_DECIMALS
 from ..models.yolo_model import YOLOModel
 from ..config import MODEL_PATH
 
@@ -12,12 +14,21 @@ router = APIRouter(prefix="", tags=["inference"])
 model = YOLOModel(MODEL_PATH)
 
 @router.post("/predict")
-async def predict(file: UploadFile = File(...)):
+async def predict(
+    file: UploadFile = File(...),
+    classes: str | None = Query(None, description="Comma-separated labels to keep"),
+    max_det: int = Query(DEFAULT_MAX_DET, ge=0),
+    min_score: float = Query(DEFAULT_MIN_SCORE, ge=0, le=1),
+    decimals: int | None = Query(None, ge=0, le=MAX_DECIMALS, description="Round coordinates; 0 returns integers"),
+    fmt: Literal["objects", "columnar"] = Query("objects", alias="format"),
+):
+    allowed = [c.strip() for c in classes.split(",") if c.strip()] if classes else None
+    options = PredictOptions(classes=allowed or None, max_det=max_det, min_score=min_score, decimals=decimals, fmt=fmt)
     try:
         content = await file.read()
         image = Image.open(io.BytesIO(content)).convert("RGB")
         inp = preprocess_image(image)
-        preds = model.predict(inp, orig_size=image.size, pil_image=image)
+        preds = model.predict(inp, orig_size=image.size, pil_image=image, options=options)
         return JSONResponse({"predictions": preds})
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,141 @@
+from typing import Any, Dict, List, Mapping, Tuple
+import numpy as np
+
+
+DEFAULT_MIN_SCORE = 0.25
+# Matches Ultralytics' own default so both backends cap results the same way
+DEFAULT_MAX_DET = 300
+# Score precision used whenever the caller asks for rounded coordinates
+SCORE_DECIMALS = 4
+# Finer rounding is meaningless for pixel coordinates and np.round overflows past ~308
+MAX_DECIMALS = 6
+OUTPUT_FORMATS = ("objects", "columnar")
+
+
+class PredictOptions:
+    def __init__(
+        self,
+        classes: List[str] | None = None,
+        max_det: int = DEFAULT_MAX_DET,
+        min_score: float = DEFAULT_MIN_SCORE,
+        decimals: int | None = None,
+        fmt: str = "objects",
+    ) -> None:
+        self.classes = classes
+        self.max_det = max_det
+        self.min_score = min_score
+        self.decimals = decimals
+        self.fmt = fmt
+
+
+def _parse_int(value: Any, name: str) -> int:
+    if isinstance(value, bool):
+        raise ValueError(f"{name} must be an integer")
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{name} must be an integer")
+        return int(value)
+    if isinstance(value, (int, str)):
+        return int(value)
+    raise ValueError(f"{name} must be an integer")
+
+
+def _parse_float(value: Any, name: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"{name} must be a number")
+    return float(value)
+
+
+def parse_predict_options(raw: Mapping[str, Any] | None) -> PredictOptions:
+    """Build PredictOptions from request params; raises ValueError on bad input.
+
+    decimals=0 yields integer coordinates, format is "objects" or "columnar",
+    classes may be a list or a comma-separated string of labels.
+    """
+    if not raw:
+        return PredictOptions()
+    classes = raw.get("classes")
+    if isinstance(classes, str):
+        classes = [c.strip() for c in classes.split(",") if c.strip()]
+    elif classes is not None:
+        if not isinstance(classes, (list, tuple)):
+            raise ValueError("classes must be a list or comma-separated string")
+        classes = [str(c) for c in classes]
+    max_det = raw.get("max_det")
+    max_det = DEFAULT_MAX_DET if max_det is None else _parse_int(max_det, "max_det")
+    if max_det < 0:
+        raise ValueError("max_det must be >= 0")
+    min_score = raw.get("min_score")
+    min_score = DEFAULT_MIN_SCORE if min_score is None else _parse_float(min_score, "min_score")
+    if not 0.0 <= min_score <= 1.0:
+        raise ValueError("min_score must be between 0 and 1")
+    decimals = raw.get("decimals")
+    if decimals is not None:
+        decimals = _parse_int(decimals, "decimals")
+        if not 0 <= decimals <= MAX_DECIMALS:
+            raise ValueError(f"decimals must be between 0 and {MAX_DECIMALS}")
+    fmt = raw.get("format") or "objects"
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(OUTPUT_FORMATS)}")
+    return PredictOptions(classes=classes or None, max_det=max_det, min_score=min_score, decimals=decimals, fmt=fmt)
+
+
+def to_numpy(x: Any) -> np.ndarray:
+    if hasattr(x, "detach"):
+        x = x.detach()
+    if hasattr(x, "cpu"):
+        x = x.cpu()
+    if hasattr(x, "numpy"):
+        return x.numpy()
+    return np.asarray(x)
+
+
+def select_detections(
+    xyxy: np.ndarray,
+    scores: np.ndarray,
+    cls_ids: np.ndarray,
+    names: Mapping[int, str],
+    options: PredictOptions,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Apply score, class and max_det filters as array masks before any dicts are built."""
+    keep = scores >= options.min_score
+    if options.classes is not None:
+        allowed = [i for i, n in names.items() if n in options.classes]
+        keep &= np.isin(cls_ids, allowed)
+    idx = np.flatnonzero(keep)
+    if idx.size > options.max_det:
+        top = np.argsort(-scores[idx], kind="stable")[:options.max_det]
+        idx = idx[np.sort(top)]
+    return xyxy[idx], scores[idx], cls_ids[idx]
+
+
+def format_detections(
+    xyxy: np.ndarray,
+    scores: np.ndarray,
+    cls_ids: np.ndarray,
+    names: Mapping[int, str],
+    options: PredictOptions,
+) -> List[Dict[str, Any]] | Dict[str, Any]:
+    if options.decimals == 0:
+        boxes = np.rint(xyxy).astype(np.int64).tolist()
+    elif options.decimals is not None:
+        boxes = np.round(xyxy.astype(np.float64), options.decimals).tolist()
+    else:
+        boxes = xyxy.astype(np.float64).tolist()
+    if options.decimals is not None:
+        score_list = np.round(scores.astype(np.float64), SCORE_DECIMALS).tolist()
+    else:
+        score_list = scores.astype(np.float64).tolist()
+    if options.fmt == "columnar":
+        uniq, inverse = np.unique(cls_ids, return_inverse=True)
+        return {
+            "bbox": boxes,
+            "score": score_list,
+            "label": inverse.astype(np.int64).tolist(),
+            "labels": [names.get(int(c), "object") for c in uniq],
+        }
+    labels = [names.get(int(c), "object") for c in cls_ids.tolist()]
+    return [
+        {"bbox": b, "score": s, "label": l}
+        for b, s, l in zip(boxes, score_list, labels)
+    ]
@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+
+from app.utils.output import (
+    DEFAULT_MAX_DET,
+    DEFAULT_MIN_SCORE,
+    PredictOptions,
+    format_detections,
+    parse_predict_options,
+    select_detections,
+)
+
+NAMES = {0: "person", 1: "car", 2: "dog"}
+
+
+def _dets():
+    xyxy = np.array([
+        [1.26, 2.0, 3.0, 4.0],
+        [5.0, 6.0, 7.0, 8.0],
+        [9.5, 10.0, 11.0, 12.0],
+        [13.0, 14.0, 15.0, 16.0],
+    ], dtype=np.float32)
+    scores = np.array([0.6, 0.1, 0.9, 0.7], dtype=np.float32)
+    cls_ids = np.array([0, 1, 1, 2], dtype=np.int64)
+    return xyxy, scores, cls_ids
+
+
+def test_parse_defaults():
+    opts = parse_predict_options(None)
+    assert opts.classes is None
+    assert opts.max_det == DEFAULT_MAX_DET
+    assert opts.min_score == DEFAULT_MIN_SCORE
+    assert opts.decimals is None
+    assert opts.fmt == "objects"
+
+
+def test_parse_values():
+    opts = parse_predict_options({"classes": "car, dog", "max_det": "5", "min_score": "0.5", "decimals": 0, "format": "columnar"})
+    assert opts.classes == ["car", "dog"]
+    assert opts.max_det == 5
+    assert opts.min_score == 0.5
+    assert opts.decimals == 0
+    assert opts.fmt == "columnar"
+    assert parse_predict_options({"classes": ["car"]}).classes == ["car"]
+    assert parse_predict_options({"max_det": 5.0, "min_score": 1}).max_det == 5
+
+
+@pytest.mark.parametrize("raw", [
+    {"max_det": -1},
+    {"decimals": -1},
+    {"decimals": 7},
+    {"decimals": 400},
+    {"min_score": "nan"},
+    {"min_score": "inf"},
+    {"min_score": -0.1},
+    {"min_score": 1.5},
+    {"format": "xml"},
+    {"classes": 3},
+    {"max_det": "many"},
+    {"max_det": 5.9},
+    {"max_det": True},
+    {"decimals": True},
+    {"decimals": "1.5"},
+    {"min_score": True},
+    {"min_score": [0.5]},
+])
+def test_parse_rejects_invalid(raw):
+    with pytest.raises(ValueError):
+        parse_predict_options(raw)
+
+
+def test_select_min_score():
+    xyxy, scores, cls_ids = select_detections(*_dets(), NAMES, PredictOptions())
+    assert scores.tolist() == pytest.approx([0.6, 0.9, 0.7])
+    assert cls_ids.tolist() == [0, 1, 2]
+
+
+def test_select_max_det_keeps_top_scores_in_original_order():
+    _, scores, cls_ids = select_detections(*_dets(), NAMES, PredictOptions(max_det=2))
+    assert scores.tolist() == pytest.approx([0.9, 0.7])
+    assert cls_ids.tolist() == [1, 2]
+
+
+def test_select_classes():
+    xyxy, _, cls_ids = select_detections(*_dets(), NAMES, PredictOptions(classes=["car"], min_score=0.0))
+    assert cls_ids.tolist() == [1, 1]
+    assert xyxy.shape == (2, 4)
+
+
+def test_select_unknown_class_returns_empty():
+    xyxy, scores, cls_ids = select_detections(*_dets(), NAMES, PredictOptions(classes=["cat"]))
+    assert xyxy.shape == (0, 4)
+    assert scores.size == 0 and cls_ids.size == 0
+
+
+def test_format_objects():
+    out = format_detections(*_dets(), NAMES, PredictOptions())
+    assert [d["label"] for d in out] == ["person", "car", "car", "dog"]
+    assert out[0]["bbox"][0] == pytest.approx(1.26)
+    assert isinstance(out[0]["score"], float)
+
+
+def test_format_integer_coordinates():
+    out = format_detections(*_dets(), NAMES, PredictOptions(decimals=0))
+    assert out[0]["bbox"] == [1, 2, 3, 4]
+    assert all(isinstance(v, int) for v in out[2]["bbox"])
+    assert out[2]["bbox"] == [10, 10, 11, 12]
+    assert out[0]["score"] == 0.6
+
+
+def test_format_rounded_coordinates():
+    out = format_detections(*_dets(), NAMES, PredictOptions(decimals=1))
+    assert out[0]["bbox"] == [1.3, 2.0, 3.0, 4.0]
+    assert out[2]["score"] == 0.9
+
+
+def test_format_columnar_label_table():
+    out = format_detections(*_dets(), NAMES, PredictOptions(fmt="columnar"))
+    assert set(out) == {"bbox", "score", "label", "labels"}
+    assert len(out["bbox"]) == len(out["score"]) == len(out["label"]) == 4
+    assert out["labels"] == ["person", "car", "dog"]
+    assert [out["labels"][i] for i in out["label"]] == ["person", "car", "car", "dog"]
+
+
+def test_format_unknown_class_id_uses_default_label():
+    xyxy, scores, _ = _dets()
+    out = format_detections(xyxy[:1], scores[:1], np.array([-1]), NAMES, PredictOptions())
+    assert out[0]["label"] == "object"
+
+
+@pytest.mark.parametrize("fmt, expected", [
+    ("objects", []),
+    ("columnar", {"bbox": [], "score": [], "label": [], "labels": []}),
+])
+def test_format_empty(fmt, expected):
+    empty = (np.zeros((0, 4)), np.zeros(0), np.zeros(0, dtype=np.int64))
+    assert format_detections(*empty, NAMES, PredictOptions(fmt=fmt)) == expected
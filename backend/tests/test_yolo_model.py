@@ -0,0 +1,172 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.models.yolo_model import YOLOModel
+from app.utils.output import DEFAULT_MAX_DET, DEFAULT_MIN_SCORE, PredictOptions
+
+NAMES = {0: "person", 1: "car", 2: "dog"}
+IMAGE = Image.new("RGB", (8, 8))
+
+
+class FakeTensor:
+    def __init__(self, data):
+        self.data = np.asarray(data)
+
+    def detach(self):
+        return self
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.data
+
+
+class FakeBoxes:
+    def __init__(self, xyxy, conf, cls):
+        self.xyxy = FakeTensor(xyxy)
+        self.conf = None if conf is None else FakeTensor(conf)
+        self.cls = None if cls is None else FakeTensor(cls)
+
+
+class FakeResult:
+    def __init__(self, boxes, names):
+        self.boxes = boxes
+        self.names = names
+
+
+class FakePtModel:
+    def __init__(self, boxes):
+        self.names = NAMES
+        self.boxes = boxes
+        self.calls = []
+
+    def predict(self, image, **kwargs):
+        self.calls.append(kwargs)
+        return [FakeResult(self.boxes, self.names)]
+
+
+class FakeInput:
+    name = "images"
+
+
+class FakeSession:
+    def __init__(self, preds):
+        self.preds = preds
+        self.feeds = []
+
+    def get_inputs(self):
+        return [FakeInput()]
+
+    def run(self, output_names, feeds):
+        self.feeds.append(feeds)
+        return [self.preds]
+
+
+def _pt_model(boxes=None):
+    if boxes is None:
+        boxes = FakeBoxes(
+            [[1.26, 2.0, 3.0, 4.0], [9.5, 10.0, 11.0, 12.0]],
+            [0.9, 0.4],
+            [1.0, 2.0],
+        )
+    model = YOLOModel(None)
+    model.pt_model = FakePtModel(boxes)
+    return model
+
+
+def _onnx_model():
+    preds = np.array([
+        [1.26, 2.0, 3.0, 4.0, 0.6, 0.0],
+        [5.0, 6.0, 7.0, 8.0, 0.1, 0.0],
+        [9.5, 10.0, 11.0, 12.0, 0.9, 0.0],
+    ], dtype=np.float32)
+    model = YOLOModel(None)
+    model.session = FakeSession(preds)
+    return model
+
+
+def test_pt_passes_default_limits_to_ultralytics():
+    model = _pt_model()
+    model.predict(None, (8, 8), pil_image=IMAGE)
+    kwargs = model.pt_model.calls[0]
+    assert kwargs["conf"] == DEFAULT_MIN_SCORE
+    assert kwargs["max_det"] == DEFAULT_MAX_DET
+    assert "classes" not in kwargs
+
+
+def test_pt_maps_options_to_ultralytics_kwargs():
+    model = _pt_model()
+    model.predict(None, (8, 8), pil_image=IMAGE, options=PredictOptions(classes=["dog", "car"], max_det=5, min_score=0.1))
+    kwargs = model.pt_model.calls[0]
+    assert kwargs["conf"] == 0.1
+    assert kwargs["max_det"] == 5
+    assert sorted(kwargs["classes"]) == [1, 2]
+
+
+@pytest.mark.parametrize("options, expected", [
+    (PredictOptions(classes=["cat"]), []),
+    (PredictOptions(max_det=0), []),
+    (PredictOptions(classes=["cat"], fmt="columnar"), {"bbox": [], "score": [], "label": [], "labels": []}),
+])
+def test_pt_skips_inference_when_nothing_can_match(options, expected):
+    model = _pt_model()
+    assert model.predict(None, (8, 8), pil_image=IMAGE, options=options) == expected
+    assert model.pt_model.calls == []
+
+
+def test_pt_objects():
+    model = _pt_model()
+    out = model.predict(None, (8, 8), pil_image=IMAGE, options=PredictOptions(decimals=0))
+    assert out == [
+        {"bbox": [1, 2, 3, 4], "score": 0.9, "label": "car"},
+        {"bbox": [10, 10, 11, 12], "score": 0.4, "label": "dog"},
+    ]
+
+
+def test_pt_columnar():
+    model = _pt_model()
+    out = model.predict(None, (8, 8), pil_image=IMAGE, options=PredictOptions(decimals=1, fmt="columnar"))
+    assert out == {
+        "bbox": [[1.3, 2.0, 3.0, 4.0], [9.5, 10.0, 11.0, 12.0]],
+        "score": [0.9, 0.4],
+        "label": [0, 1],
+        "labels": ["car", "dog"],
+    }
+
+
+def test_pt_missing_conf_and_cls_fall_back():
+    model = _pt_model(FakeBoxes([[1.0, 2.0, 3.0, 4.0]], None, None))
+    out = model.predict(None, (8, 8), pil_image=IMAGE)
+    assert out == [{"bbox": [1.0, 2.0, 3.0, 4.0], "score": 0.0, "label": "object"}]
+
+
+def test_onnx_objects_filters_by_score():
+    model = _onnx_model()
+    inp = np.zeros((1, 3, 8, 8), dtype=np.float32)
+    out = model.predict(inp, (8, 8), options=PredictOptions(decimals=0))
+    assert out == [
+        {"bbox": [1, 2, 3, 4], "score": 0.6, "label": "object"},
+        {"bbox": [10, 10, 11, 12], "score": 0.9, "label": "object"},
+    ]
+    assert model.session.feeds[0]["images"] is inp
+
+
+def test_onnx_columnar_max_det():
+    model = _onnx_model()
+    out = model.predict(np.zeros((1, 3, 8, 8), dtype=np.float32), (8, 8), options=PredictOptions(max_det=1, decimals=0, fmt="columnar"))
+    assert out == {"bbox": [[10, 10, 11, 12]], "score": [0.9], "label": [0], "labels": ["object"]}
+
+
+def test_onnx_classes_allow_list():
+    model = _onnx_model()
+    inp = np.zeros((1, 3, 8, 8), dtype=np.float32)
+    assert model.predict(inp, (8, 8), options=PredictOptions(classes=["car"])) == []
+    assert len(model.predict(inp, (8, 8), options=PredictOptions(classes=["object"]))) == 2
+
+
+def test_no_backend_returns_empty():
+    assert YOLOModel(None).predict(None, (8, 8), options=PredictOptions(fmt="columnar")) == {
+        "bbox": [], "score": [], "label": [], "labels": []
+    }